@@ -1,8 +1,25 @@
 """Monzo Financial Tracker - A comprehensive financial tracking tool."""
 
-from .auth import TokenManager
-from .api import MonzoAPI
-from .models import format_transaction
-from .spreadsheet import write_transactions
+__all__ = ["TokenManager", "MonzoAPI", "format_transaction", "write_transactions", "SpreadsheetWriter"]
 
-__all__ = ["TokenManager", "MonzoAPI", "format_transaction", "write_transactions"]
+# Public name -> submodule, resolved lazily so `import monzo_tracker`
+# (and `monzo-tracker --help`) doesn't pay for pydantic/openpyxl/requests
+_EXPORTS = {
+    "TokenManager": ".auth",
+    "MonzoAPI": ".api",
+    "format_transaction": ".models",
+    "write_transactions": ".spreadsheet",
+    "SpreadsheetWriter": ".spreadsheet",
+}
+
+
+def __getattr__(name):
+    """Import public names on first access (PEP 562)."""
+    try:
+        submodule = _EXPORTS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+
+    from importlib import import_module
+
+    return getattr(import_module(submodule, __name__), name)
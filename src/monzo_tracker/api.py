@@ -1,8 +1,12 @@
 """Monzo API client with automatic token refresh."""
 
+import time
 from datetime import datetime, timedelta
+from typing import Iterator
 
+import orjson
 import requests
+from requests.adapters import HTTPAdapter
 
 from .auth import TokenManager
 
@@ -12,28 +16,74 @@ class MonzoAPI:
 
     API_URL = 'https://api.monzo.com'
 
+    # How long a token fetched from the manager is trusted without re-checking
+    TOKEN_CACHE_SECONDS = 60
+
     def __init__(self, token_manager: TokenManager):
         self.token_manager = token_manager
 
-    def _make_request(self, method: str, endpoint: str, **kwargs) -> requests.Response:
+        # Cache the validated access token so back-to-back pagination calls
+        # skip the manager's expiry bookkeeping on every request.
+        self._cached_token = None
+        self._cached_until = 0.0
+
+        # Persistent session so sequential pagination calls reuse the same
+        # TCP/TLS connection instead of paying a handshake per request.
+        self._session = requests.Session()
+        self._session.mount('https://', HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=20,
+            max_retries=0,
+        ))
+        self._session.headers.update({'User-Agent': 'monzo-tracker/1.0'})
+
+        # Share the session with the token manager so the OAuth token
+        # endpoint reuses the same connection pool.
+        self.token_manager.session = self._session
+
+    def close(self):
+        """Close the underlying HTTP session."""
+        self._session.close()
+
+    def _make_request(
+        self,
+        method: str,
+        endpoint: str,
+        *,
+        params: dict | None = None,
+        data: dict | None = None,
+    ) -> requests.Response:
         """Make an API request with automatic token refresh on 401."""
         max_retries = 2
+        url = f"{self.API_URL}{endpoint}"
+
+        # Authorization stays per-request (not on the session) so token
+        # rotation on 401 takes effect immediately. One dict serves every
+        # attempt; only the token value is rewritten.
+        headers = {'Authorization': ''}
 
         for attempt in range(max_retries):
-            access_token = self.token_manager.get_access_token()
+            now = time.monotonic()
+            if self._cached_token and now < self._cached_until:
+                access_token = self._cached_token
+            else:
+                access_token = self.token_manager.get_access_token()
+                self._cached_token = access_token
+                self._cached_until = now + self.TOKEN_CACHE_SECONDS
 
-            headers = kwargs.pop('headers', {})
             headers['Authorization'] = f'Bearer {access_token}'
 
-            response = requests.request(
+            response = self._session.request(
                 method,
-                f"{self.API_URL}{endpoint}",
+                url,
                 headers=headers,
-                **kwargs
+                params=params,
+                data=data,
             )
 
             if response.status_code == 401:
                 print("Token expired or invalid, re-authenticating...")
+                self._cached_token = None
                 self.token_manager.invalidate()
                 continue  # Retry with new token
 
@@ -46,41 +96,48 @@ class MonzoAPI:
         response = self._make_request('GET', '/accounts')
 
         if response.status_code == 200:
-            return response.json()['accounts']
+            return orjson.loads(response.content)['accounts']
         else:
             raise Exception(f"Failed to get accounts: {response.status_code} - {response.text}")
 
-    def get_transactions(self, account_id: str, days: int = 30) -> list[dict]:
-        """Retrieve transactions for the last N days, paginating through all results."""
+    def iter_transactions(self, account_id: str, days: int = 30) -> Iterator[dict]:
+        """Yield transactions for the last N days, page by page.
+
+        Streaming keeps only one page of raw dicts alive at a time, so
+        callers can format/consume rows while later pages are fetched.
+        """
         since = datetime.now() - timedelta(days=days)
         since_str = since.strftime('%Y-%m-%dT%H:%M:%SZ')
 
-        all_transactions = []
+        # Each page costs a full round trip, so use Monzo's maximum page size
+        # and reuse the params dict across iterations (only the cursor changes).
+        page_size = 200
+        params = {
+            'account_id': account_id,
+            'since': since_str,
+            'expand[]': 'merchant',
+            'limit': page_size,
+        }
 
         while True:
-            params = {
-                'account_id': account_id,
-                'since': since_str,
-                'expand[]': 'merchant',
-                'limit': 100,
-            }
-
             response = self._make_request('GET', '/transactions', params=params)
 
             if response.status_code != 200:
                 raise Exception(f"Failed to get transactions: {response.status_code} - {response.text}")
 
-            batch = response.json()['transactions']
+            batch = orjson.loads(response.content)['transactions']
             if not batch:
                 break
 
-            all_transactions.extend(batch)
+            yield from batch
 
             # Use the last transaction's ID as the cursor for the next page
-            since_str = batch[-1]['id']
+            params['since'] = batch[-1]['id']
 
             # If we got fewer than the limit, we've reached the end
-            if len(batch) < 100:
+            if len(batch) < page_size:
                 break
 
-        return all_transactions
+    def get_transactions(self, account_id: str, days: int = 30) -> list[dict]:
+        """Retrieve transactions for the last N days as a fully materialized list."""
+        return list(self.iter_transactions(account_id, days=days))
@@ -1,13 +1,14 @@
 """OAuth authentication and token management for Monzo API."""
 
-import json
 import os
+import threading
 import time
 import webbrowser
 from http.server import HTTPServer, BaseHTTPRequestHandler
 from pathlib import Path
-from urllib.parse import urlparse, parse_qs
+from urllib.parse import urlencode, urlparse, parse_qs
 
+import orjson
 import requests
 
 # Token storage
@@ -18,6 +19,18 @@ TOKEN_EXPIRY_BUFFER = 300  # 5 minutes buffer before expiration
 class OAuthCallbackHandler(BaseHTTPRequestHandler):
     """Handler for OAuth callback."""
 
+    # Send the tiny response immediately rather than letting it sit in
+    # the kernel buffer waiting for more data
+    disable_nagle_algorithm = True
+
+    def address_string(self):
+        """Return the client IP without the default reverse-DNS lookup.
+
+        The base class resolves a hostname per connection, which can stall
+        the callback for seconds on networks with broken reverse DNS.
+        """
+        return self.client_address[0]
+
     def do_GET(self):
         """Handle the OAuth callback."""
         query = urlparse(self.path).query
@@ -52,15 +65,16 @@ def start_oauth_flow(client_id: str, redirect_uri: str, auth_url: str) -> str |
         'state': 'random_state_string'  # In production, use a secure random string
     }
 
-    full_auth_url = f"{auth_url}/?{'&'.join([f'{k}={v}' for k, v in auth_params.items()])}"
+    full_auth_url = f"{auth_url}/?{urlencode(auth_params)}"
 
     print("Opening browser for authentication...")
     print(f"If browser doesn't open, visit: {full_auth_url}")
 
     webbrowser.open(full_auth_url)
 
-    # Start local server to receive callback
-    server = HTTPServer(('localhost', 8080), OAuthCallbackHandler)
+    # Start local server to receive callback. Bind the loopback IP
+    # directly so 'localhost' doesn't go through IPv6/AAAA resolution.
+    server = HTTPServer(('127.0.0.1', 8080), OAuthCallbackHandler)
     server.auth_code = None
 
     print("Waiting for authentication callback...")
@@ -74,7 +88,8 @@ def exchange_code_for_token(
     client_id: str,
     client_secret: str,
     redirect_uri: str,
-    api_url: str
+    api_url: str,
+    session: requests.Session | None = None
 ) -> dict:
     """Exchange authorization code for access token."""
     token_url = f"{api_url}/oauth2/token"
@@ -87,7 +102,7 @@ def exchange_code_for_token(
         'code': auth_code
     }
 
-    response = requests.post(token_url, data=data)
+    response = (session or requests).post(token_url, data=data)
 
     if response.status_code == 200:
         return response.json()
@@ -104,23 +119,26 @@ class TokenManager:
         client_secret: str,
         redirect_uri: str,
         auth_url: str = 'https://auth.monzo.com',
-        api_url: str = 'https://api.monzo.com'
+        api_url: str = 'https://api.monzo.com',
+        session: requests.Session | None = None
     ):
         self.client_id = client_id
         self.client_secret = client_secret
         self.redirect_uri = redirect_uri
         self.auth_url = auth_url
         self.api_url = api_url
+        self.session = session
         self.token_data = None
+        # Serializes refresh/re-auth when API calls run on multiple threads
+        self._lock = threading.Lock()
         self._load_tokens()
 
     def _load_tokens(self):
         """Load tokens from disk if they exist."""
         if TOKEN_FILE.exists():
             try:
-                with open(TOKEN_FILE, 'r') as f:
-                    self.token_data = json.load(f)
-            except (json.JSONDecodeError, IOError):
+                self.token_data = orjson.loads(TOKEN_FILE.read_bytes())
+            except (orjson.JSONDecodeError, IOError):
                 self.token_data = None
 
     def _save_tokens(self, token_response: dict):
@@ -133,14 +151,17 @@ class TokenManager:
             'user_id': token_response.get('user_id')
         }
 
-        with open(TOKEN_FILE, 'w') as f:
-            json.dump(self.token_data, f, indent=2)
-
-        # Set file permissions to owner-only (Unix/Linux/Mac)
+        # Write to a temp file and rename into place: the rename is atomic,
+        # so a crash mid-write can't corrupt the token file, and setting
+        # permissions before the rename means the final file is never
+        # briefly world-readable.
+        tmp = TOKEN_FILE.with_suffix('.tmp')
+        tmp.write_bytes(orjson.dumps(self.token_data, option=orjson.OPT_INDENT_2))
         try:
-            os.chmod(TOKEN_FILE, 0o600)
+            os.chmod(tmp, 0o600)
         except OSError:
             pass  # Windows doesn't support this
+        tmp.replace(TOKEN_FILE)
 
     def is_token_valid(self) -> bool:
         """Check if current token is valid and not expired."""
@@ -152,21 +173,22 @@ class TokenManager:
 
     def get_access_token(self) -> str:
         """Get a valid access token, refreshing or re-authenticating as needed."""
-        # Try existing token first
-        if self.is_token_valid():
-            return self.token_data['access_token']
-
-        # Try refresh token if available
-        if self.token_data and self.token_data.get('refresh_token'):
-            try:
-                return self._refresh_token()
-            except Exception as e:
-                print(f"Token refresh failed: {e}")
-                # Fall through to full re-auth
-
-        # Full re-authentication required
-        print("Authentication required. Starting OAuth flow...")
-        return self._full_authentication()
+        with self._lock:
+            # Try existing token first
+            if self.is_token_valid():
+                return self.token_data['access_token']
+
+            # Try refresh token if available
+            if self.token_data and self.token_data.get('refresh_token'):
+                try:
+                    return self._refresh_token()
+                except Exception as e:
+                    print(f"Token refresh failed: {e}")
+                    # Fall through to full re-auth
+
+            # Full re-authentication required
+            print("Authentication required. Starting OAuth flow...")
+            return self._full_authentication()
 
     def _refresh_token(self) -> str:
         """Attempt to refresh the access token using refresh_token."""
@@ -179,7 +201,7 @@ class TokenManager:
             'refresh_token': self.token_data['refresh_token']
         }
 
-        response = requests.post(f"{self.api_url}/oauth2/token", data=data)
+        response = (self.session or requests).post(f"{self.api_url}/oauth2/token", data=data)
 
         if response.status_code == 200:
             token_response = response.json()
@@ -200,7 +222,8 @@ class TokenManager:
             self.client_id,
             self.client_secret,
             self.redirect_uri,
-            self.api_url
+            self.api_url,
+            session=self.session
         )
         self._save_tokens(token_response)
 
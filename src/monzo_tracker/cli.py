@@ -3,21 +3,12 @@
 
 import argparse
 import os
+import sys
+from concurrent.futures import ThreadPoolExecutor
 
-from dotenv import load_dotenv
-
-from .auth import TokenManager, TOKEN_FILE
-from .api import MonzoAPI
-from .models import format_transaction
-from .spreadsheet import write_transactions
-
-# Load environment variables from .env file
-load_dotenv()
-
-# Configuration
-CLIENT_ID = os.getenv('MONZO_CLIENT_ID')
-CLIENT_SECRET = os.getenv('MONZO_CLIENT_SECRET')
-REDIRECT_URI = os.getenv('MONZO_REDIRECT_URI', 'http://localhost:8080/callback')
+# The heavy dependencies (requests, pydantic, openpyxl, dotenv) are imported
+# inside the functions that need them, so `monzo-tracker --help` and the
+# --reauth token clear don't pay for them at startup.
 
 
 def main():
@@ -29,12 +20,24 @@ def main():
     print("=== Monzo API Transaction Scraper ===\n")
 
     if args.reauth:
+        # Clearing tokens only needs the file path, not the auth stack
+        from .auth import TOKEN_FILE
+
         if TOKEN_FILE.exists():
             TOKEN_FILE.unlink()
             print("Tokens cleared. Will re-authenticate.\n")
         else:
             print("No saved tokens found.\n")
 
+    # Load environment variables from .env file
+    from dotenv import load_dotenv
+    load_dotenv()
+
+    # Configuration
+    CLIENT_ID = os.getenv('MONZO_CLIENT_ID')
+    CLIENT_SECRET = os.getenv('MONZO_CLIENT_SECRET')
+    REDIRECT_URI = os.getenv('MONZO_REDIRECT_URI', 'http://localhost:8080/callback')
+
     # Check if credentials are set
     if not CLIENT_ID or not CLIENT_SECRET:
         print("ERROR: Please set your Monzo API credentials in the .env file!")
@@ -50,54 +53,93 @@ def main():
         return
 
     try:
+        from .auth import TokenManager
+        from .api import MonzoAPI
+
         # Initialize token manager and API client
         token_manager = TokenManager(CLIENT_ID, CLIENT_SECRET, REDIRECT_URI)
         api = MonzoAPI(token_manager)
+        try:
+            _run(api)
+        finally:
+            api.close()
 
-        # Get accounts (will auto-authenticate if needed)
-        accounts = api.get_accounts()
-        print(f"Found {len(accounts)} account(s)")
-
-        # Get transactions for each account
-        for account in accounts:
-            account_id = account['id']
-            account_desc = account.get('description', 'Unknown')
-
-            print(f"\n--- Account: {account_desc} ({account_id[:10]}...) ---")
-
-            transactions = api.get_transactions(account_id, days=30)
-            print(f"Retrieved {len(transactions)} transactions from last 30 days\n")
-
-            if transactions:
-                # Format and display transactions
-                formatted_txs = [format_transaction(tx) for tx in transactions]
+    except Exception as e:
+        print(f"\nError: {str(e)}")
+        import traceback
+        traceback.print_exc()
 
-                # Sort by date (most recent first)
-                formatted_txs.sort(key=lambda x: x.date, reverse=True)
 
-                # Display transactions
-                print(f"{'Date':<19} | {'Amount':>12} | {'Category':<15} | Description")
-                print("-" * 80)
-                for tx in formatted_txs:
-                    print(f"{tx.date} | {tx.amount:>12} | {tx.category:<15} | {tx.description}")
-                    if tx.notes:
-                        print(f"               Notes: {tx.notes}")
-                    print()
+def _run(api):
+    """Fetch and process transactions for all accounts."""
+    from .models import format_transactions_batch
+    from .spreadsheet import SpreadsheetWriter
 
-                # Save to spreadsheet
-                filepath = write_transactions(formatted_txs)
-                print(f"Transactions saved to {filepath}")
+    # Get accounts (will auto-authenticate if needed)
+    accounts = api.get_accounts()
+    print(f"Found {len(accounts)} account(s)")
 
-                # Summary
-                total = sum(tx.amount_raw for tx in formatted_txs)
-                print(f"\nTotal spent: £{total:.2f}")
-            else:
-                print("No transactions found in the last 30 days")
+    if not accounts:
+        return
 
-    except Exception as e:
-        print(f"\nError: {str(e)}")
-        import traceback
-        traceback.print_exc()
+    # Fetch each account's transactions concurrently. The per-account fetches
+    # are independent pagination chains, so wall time is bounded by the
+    # slowest account instead of the sum of all of them. Formatting happens
+    # as pages stream in, so raw dicts are dropped page by page.
+    with ThreadPoolExecutor(max_workers=min(len(accounts), 4)) as pool:
+        results = list(pool.map(
+            lambda account: format_transactions_batch(
+                api.iter_transactions(account['id'], days=30)
+            ),
+            accounts,
+        ))
+
+    # Process each account's transactions, queueing rows for a single
+    # workbook write at the end instead of loading/saving the spreadsheet
+    # once per account.
+    with SpreadsheetWriter() as writer:
+        for account, formatted_txs in zip(accounts, results):
+            _show_account(account, formatted_txs, writer)
+
+    if writer.written_path:
+        print(f"\nTransactions saved to {writer.written_path}")
+
+
+def _show_account(account: dict, formatted_txs: list, writer):
+    """Display one account's transactions and queue them for writing."""
+    account_id = account['id']
+    account_desc = account.get('description', 'Unknown')
+
+    print(f"\n--- Account: {account_desc} ({account_id[:10]}...) ---")
+    print(f"Retrieved {len(formatted_txs)} transactions from last 30 days\n")
+
+    if formatted_txs:
+        # Most recent first. Monzo returns transactions in
+        # chronological order and pagination/formatting preserve it,
+        # so reversing is enough — no O(N log N) sort needed.
+        formatted_txs.reverse()
+
+        # Display transactions. Build the whole table and write it in
+        # one go — per-row print() calls flush (and lock stdout)
+        # separately, which crawls on thousands of rows.
+        print(f"{'Date':<19} | {'Amount':>12} | {'Category':<15} | Description")
+        print("-" * 80)
+        lines = [
+            f"{tx.date} | {tx.amount:>12} | {tx.category:<15} | {tx.description}"
+            + (f"\n               Notes: {tx.notes}" if tx.notes else "")
+            for tx in formatted_txs
+        ]
+        sys.stdout.write("\n\n".join(lines) + "\n\n")
+
+        # Queue for the spreadsheet write
+        writer.extend(formatted_txs)
+
+        # Summary — sum in integer pence (exact, and cheaper than a
+        # float accumulation), convert to pounds once at the end
+        total = sum(tx.amount_pence for tx in formatted_txs) / 100
+        print(f"\nTotal spent: £{total:.2f}")
+    else:
+        print("No transactions found in the last 30 days")
 
 
 if __name__ == '__main__':
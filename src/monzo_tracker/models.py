@@ -1,7 +1,8 @@
 """Data models and formatting for Monzo transactions."""
 
+from dataclasses import dataclass
 from datetime import datetime
-from typing import Optional
+from typing import Iterable, Optional
 
 from pydantic import BaseModel, Field, computed_field
 
@@ -42,14 +43,20 @@ class Transaction(BaseModel):
         return self.description or "Unknown"
 
 
-class FormattedTransaction(BaseModel):
-    """Formatted transaction for display."""
+@dataclass(slots=True, frozen=True)
+class FormattedTransaction:
+    """Formatted transaction for display.
+
+    A plain dataclass rather than a Pydantic model: these are built once
+    per transaction in a tight loop, where validator overhead adds up.
+    """
 
     id: str
     date: str
     description: str
     amount: str
     amount_raw: float
+    amount_pence: int
     currency: str
     category: str
     notes: str
@@ -64,6 +71,7 @@ class FormattedTransaction(BaseModel):
             description=tx.display_description,
             amount=f"{currency} {tx.amount_pounds:.2f}",
             amount_raw=tx.amount_pounds,
+            amount_pence=tx.amount,
             currency=currency,
             category=tx.category,
             notes=tx.notes,
@@ -73,17 +81,118 @@ class FormattedTransaction(BaseModel):
 def format_transaction(tx: dict) -> FormattedTransaction:
     """Format a raw transaction for display.
 
+    Works directly on the raw dict: Monzo's `created` field is already
+    ISO-8601, so the date can be sliced without a datetime round-trip,
+    and no intermediate model needs validating per row.
+
     Args:
         tx: Raw transaction dict from Monzo API
 
     Returns:
-        FormattedTransaction model instance
+        FormattedTransaction instance
+    """
+    # "2026-01-05T12:34:56.789Z" -> "2026-01-05 12:34:56"
+    date = tx["created"][:19].replace("T", " ")
+    amount_pence = tx["amount"]
+    amount_pounds = amount_pence / 100
+    currency = tx["currency"].upper()
+
+    merchant = tx.get("merchant")
+    description = (merchant or {}).get("name") or tx.get("description") or "Unknown"
+
+    return FormattedTransaction(
+        id=tx["id"],
+        date=date,
+        description=description,
+        amount=f"{currency} {amount_pounds:.2f}",
+        amount_raw=amount_pounds,
+        amount_pence=amount_pence,
+        currency=currency,
+        category=tx.get("category") or "unknown",
+        notes=tx.get("notes") or "",
+    )
+
+
+def format_transactions_batch(txs: Iterable[dict]) -> list[FormattedTransaction]:
+    """Format a batch of raw transactions in a single pass.
+
+    Equivalent to calling :func:`format_transaction` per row, but with the
+    loop-invariant lookups bound once so the hot loop only does per-row work.
+    Accepts any iterable, so rows streamed from pagination are formatted
+    (and the raw dicts dropped) as they arrive.
+
+    Args:
+        txs: Raw transaction dicts from Monzo API
+
+    Returns:
+        List of FormattedTransaction instances, in input order
+    """
+    make = FormattedTransaction
+    result = []
+    append = result.append
+
+    # A single account's transactions are almost always one currency, so
+    # specialize the amount template for the last currency seen instead of
+    # re-uppercasing and re-templating per row.
+    last_raw_currency = None
+    currency = ""
+    amount_fmt = None
+
+    # Repeat merchants are common (the weekly supermarket run), so resolve
+    # each merchant id's display name once instead of chaining .get() calls
+    # on every row.
+    merchant_names: dict[str, str] = {}
+
+    for tx in txs:
+        raw_currency = tx["currency"]
+        if raw_currency != last_raw_currency:
+            last_raw_currency = raw_currency
+            currency = raw_currency.upper()
+            amount_fmt = (currency + " %.2f").__mod__
+
+        date = tx["created"][:19].replace("T", " ")
+        amount_pence = tx["amount"]
+        amount_pounds = amount_pence / 100
+
+        merchant = tx.get("merchant")
+        merchant_id = merchant.get("id") if merchant else None
+        if merchant_id:
+            name = merchant_names.get(merchant_id)
+            if name is None:
+                name = merchant.get("name")
+                if name:
+                    merchant_names[merchant_id] = name
+            description = name or tx.get("description") or "Unknown"
+        else:
+            # Id-less merchants can't be cached but still name the row
+            description = (merchant or {}).get("name") or tx.get("description") or "Unknown"
+
+        append(make(
+            id=tx["id"],
+            date=date,
+            description=description,
+            amount=amount_fmt(amount_pounds),
+            amount_raw=amount_pounds,
+            amount_pence=amount_pence,
+            currency=currency,
+            category=tx.get("category") or "unknown",
+            notes=tx.get("notes") or "",
+        ))
+
+    return result
+
+
+def format_transaction_strict(tx: dict) -> FormattedTransaction:
+    """Format a raw transaction via full Pydantic validation.
+
+    Slower than :func:`format_transaction`; use when the input shape
+    should be checked rather than trusted.
     """
-    # Parse the raw dict into a Transaction model
-    raw_tx = tx.copy()
-    # Handle the Z suffix in ISO format
-    if isinstance(raw_tx.get("created"), str):
-        raw_tx["created"] = raw_tx["created"].replace("Z", "+00:00")
+    created = tx.get("created")
+    if isinstance(created, str):
+        # Parse once here (handling the Z suffix) instead of copying the
+        # dict and leaving the coercion to the validator
+        tx = {**tx, "created": datetime.fromisoformat(created.replace("Z", "+00:00"))}
 
-    transaction = Transaction.model_validate(raw_tx)
+    transaction = Transaction.model_validate(tx)
     return FormattedTransaction.from_transaction(transaction)
@@ -1,10 +1,12 @@
 """Excel spreadsheet writer for Monzo transactions."""
 
 import os
-from collections import defaultdict
-from datetime import datetime
+from bisect import bisect_right
+from dataclasses import dataclass, field
+from itertools import groupby
 
 from openpyxl import Workbook, load_workbook
+from openpyxl.cell import WriteOnlyCell
 from openpyxl.comments import Comment
 from openpyxl.styles import Alignment, Border, Font, PatternFill, Side
 from openpyxl.utils import get_column_letter
@@ -35,6 +37,12 @@ PROJECTED_SUMMARY_FONT = Font(bold=True, italic=True, size=11, color="999999")
 PROJECTED_BALANCE_FONT = Font(bold=True, italic=True, size=12, color="999999")
 PROJECTED_CAT_TOTAL_FONT = Font(bold=True, italic=True, size=9, color="999999")
 
+SUBTOTAL_FONT = Font(italic=True, size=9)
+
+# Yearly overview styling
+YEAR_TOTAL_HEADER_FONT = Font(bold=True, size=10)
+YEAR_CAT_TOTAL_FONT = Font(bold=True, size=9)
+
 THIN_BORDER = Border(
     bottom=Side(style="thin", color="CCCCCC"),
 )
@@ -42,6 +50,10 @@ THICK_BORDER = Border(
     top=Side(style="medium"),
     bottom=Side(style="medium"),
 )
+SUBTOTAL_TOP_BORDER = Border(top=Side(style="thin"))
+MEDIUM_BOTTOM_BORDER = Border(bottom=Side(style="medium"))
+
+RIGHT_ALIGN = Alignment(horizontal="right")
 
 # Column layout: A=Date, B=Description, C=Amount, D=ID (hidden for dedup)
 COL_DATE = 1
@@ -51,6 +63,17 @@ COL_ID = 4
 
 COLUMN_WIDTHS = {COL_DATE: 20, COL_DESC: 35, COL_AMOUNT: 15, COL_ID: 5}
 
+# Column letters precomputed once: get_column_letter redoes its base-26
+# arithmetic per call, and the yearly writer needs a letter per formula ref
+COL_LETTERS = ('',) + tuple(get_column_letter(i) for i in range(1, 30))
+
+
+# Month-name tables so sheet names round-trip by indexing instead of the
+# much slower datetime.strptime/strftime
+MONTH_NAMES = ("January", "February", "March", "April", "May", "June",
+               "July", "August", "September", "October", "November", "December")
+MONTH_NUM = {name: i + 1 for i, name in enumerate(MONTH_NAMES)}
+
 
 def _month_key(tx: FormattedTransaction) -> str:
     """Get month key like '2026-01' from a transaction."""
@@ -59,18 +82,30 @@ def _month_key(tx: FormattedTransaction) -> str:
 
 def _month_sheet_name(month_key: str) -> str:
     """Convert '2026-01' to 'January 2026'."""
-    dt = datetime.strptime(month_key, "%Y-%m")
-    return dt.strftime("%B %Y")
+    year, month = month_key.split("-")
+    return f"{MONTH_NAMES[int(month) - 1]} {year}"
+
+
+def _parse_sheet_month(name: str) -> str | None:
+    """Parse a month sheet name like 'January 2026' to '2026-01', or None."""
+    month_name, _, year = name.partition(" ")
+    month = MONTH_NUM.get(month_name)
+    if month is None or not year.isdigit():
+        return None
+    return f"{year}-{month:02d}"
 
 
 def _get_existing_ids(ws) -> set[str]:
-    """Read all transaction IDs already in a worksheet (column D)."""
-    ids = set()
-    for row in ws.iter_rows(min_col=COL_ID, max_col=COL_ID, values_only=False):
-        cell = row[0]
-        if cell.value and str(cell.value).startswith("tx_"):
-            ids.add(str(cell.value))
-    return ids
+    """Read all transaction IDs already in a worksheet (column D).
+
+    values_only skips openpyxl's Cell object construction per row, which
+    dominates a scan that only needs one string per row.
+    """
+    return {
+        v
+        for (v,) in ws.iter_rows(min_col=COL_ID, max_col=COL_ID, values_only=True)
+        if isinstance(v, str) and v.startswith("tx_")
+    }
 
 
 def _get_previous_balance(wb, current_month_key: str) -> float:
@@ -78,12 +113,9 @@ def _get_previous_balance(wb, current_month_key: str) -> float:
     # Collect all month sheet names and sort them
     month_sheets = []
     for name in wb.sheetnames:
-        try:
-            dt = datetime.strptime(name, "%B %Y")
-            mk = dt.strftime("%Y-%m")
+        mk = _parse_sheet_month(name)
+        if mk is not None:
             month_sheets.append((mk, name))
-        except ValueError:
-            continue
 
     month_sheets.sort(key=lambda x: x[0])
 
@@ -125,25 +157,40 @@ def write_transactions(
     if filepath is None:
         filepath = os.path.abspath(SPREADSHEET_PATH)
 
-    # Group transactions by month
-    by_month: dict[str, list[FormattedTransaction]] = defaultdict(list)
-    for tx in transactions:
-        by_month[_month_key(tx)].append(tx)
-
-    # Load or create workbook
-    if os.path.exists(filepath):
-        wb = load_workbook(filepath)
-    else:
-        wb = Workbook()
-        # Remove the default empty sheet
-        if "Sheet" in wb.sheetnames:
-            del wb["Sheet"]
-
-    # Process each month
-    sorted_months = sorted(by_month.keys())
-    for month_key in sorted_months:
+    # Start every write with a cold scan memo: it is keyed by worksheet id,
+    # and stale entries from a freed workbook could alias a new one's sheets
+    _SCAN_CACHE.clear()
+
+    # Group transactions by month: one sort orders the groups, then groupby
+    # slices them out without the per-row dict hashing of a defaultdict
+    transactions = sorted(transactions, key=lambda t: t.date)
+    by_month: dict[str, list[FormattedTransaction]] = {
+        mk: list(group) for mk, group in groupby(transactions, key=_month_key)
+    }
+
+    # Brand-new file: stream it in write-only mode, which is considerably
+    # faster and lighter than building a full in-memory cell matrix
+    if not os.path.exists(filepath):
+        return _write_workbook_fresh(filepath, by_month)
+
+    # Existing file: load it so months can be merged/deduplicated in place
+    wb = load_workbook(filepath)
+
+    # Month sheets already in the workbook, keyed by month
+    existing_months: dict[str, str] = {}
+    for name in wb.sheetnames:
+        mk = _parse_sheet_month(name)
+        if mk is not None:
+            existing_months[mk] = name
+
+    # Years whose overview sheets need rebuilding at the end
+    changed_years: set[str] = set()
+
+    # Decide which months need (re)writing: merge new transactions into
+    # their existing sheets, dropping duplicates by ID
+    to_write: dict[str, list[FormattedTransaction]] = {}
+    for month_key, month_txs in by_month.items():
         sheet_name = _month_sheet_name(month_key)
-        month_txs = by_month[month_key]
 
         if sheet_name in wb.sheetnames:
             # Sheet exists — get existing IDs and filter out duplicates
@@ -152,108 +199,574 @@ def write_transactions(
             new_txs = [tx for tx in month_txs if tx.id not in existing_ids]
             if not new_txs:
                 continue
+            # A handful of new rows whose categories already exist can be
+            # spliced in without reading and rewriting the whole sheet
+            if len(new_txs) <= APPEND_THRESHOLD and _append_month_rows(ws, new_txs):
+                changed_years.add(month_key[:4])
+                continue
             # Rebuild the sheet with merged data: existing + new
             all_txs = _read_transactions_from_sheet(ws) + new_txs
-            del wb[sheet_name]
         else:
             all_txs = month_txs
 
-        ws = wb.create_sheet(title=sheet_name)
-        _write_month_sheet(ws, sheet_name, all_txs)
+        to_write[month_key] = all_txs
 
-    # Sort sheets chronologically
-    _sort_sheets(wb)
+    # Walk every month chronologically, accumulating the running balance in
+    # Python: rewritten sheets get it baked in as they're written, untouched
+    # sheets are only patched if an earlier month shifted their balance
+    balance = 0.0
+    for month_key in sorted(set(existing_months) | set(to_write)):
+        if month_key in to_write:
+            sheet_name = _month_sheet_name(month_key)
+            if sheet_name in wb.sheetnames:
+                # Rebuild the existing sheet in place
+                ws = wb[sheet_name]
+                _clear_sheet(ws)
+            else:
+                ws = wb.create_sheet(title=sheet_name)
+            balance = _write_month_sheet(ws, sheet_name, to_write[month_key], balance)
+            changed_years.add(month_key[:4])
+        else:
+            ws = wb[existing_months[month_key]]
+            summary = _extract_month_summary(ws)
+            balance += summary["net_change"]
+            if abs(summary["running_balance"] - balance) > 1e-9:
+                _set_running_balance(ws, balance)
+                changed_years.add(month_key[:4])
 
-    # Recalculate running balances across all sheets
-    _recalculate_balances(wb)
+    # Rebuild yearly overviews, but only for years whose months changed
+    # (sorts the sheets once they're in place)
+    _write_yearly_overviews(wb, changed_years)
 
-    # Build yearly overview sheets
-    _write_yearly_overviews(wb)
+    wb.save(filepath)
+    return filepath
+
+
+def _write_workbook_fresh(filepath: str, by_month: dict[str, list[FormattedTransaction]]) -> str:
+    """Write a brand-new workbook with month sheets streamed in write-only mode.
+
+    Write-only worksheets are appended row by row and serialized straight to
+    disk, so running balances are computed up front — streamed rows can't be
+    patched afterwards. Yearly overviews need to read the month sheets back,
+    which write-only sheets don't support, so the file is reopened once to
+    add them.
+    """
+    wb = Workbook(write_only=True)
 
+    balance = 0.0
+    for month_key in sorted(by_month.keys()):
+        sheet_name = _month_sheet_name(month_key)
+        ws = wb.create_sheet(title=sheet_name)
+        balance = _stream_month_sheet(ws, sheet_name, by_month[month_key], balance)
+
+    wb.save(filepath)
+
+    # Reopen to build the yearly overviews (which also sorts the sheets)
+    wb = load_workbook(filepath)
+    _write_yearly_overviews(wb)
     wb.save(filepath)
     return filepath
 
 
+def _wo_cell(ws, value=None, *, font=None, fill=None, border=None,
+             number_format=None, alignment=None):
+    """Build a styled cell for a write-only worksheet row."""
+    cell = WriteOnlyCell(ws, value=value)
+    if font is not None:
+        cell.font = font
+    if fill is not None:
+        cell.fill = fill
+    if border is not None:
+        cell.border = border
+    if number_format is not None:
+        cell.number_format = number_format
+    if alignment is not None:
+        cell.alignment = alignment
+    return cell
+
+
+def _stream_month_sheet(ws, title: str, transactions: list[FormattedTransaction],
+                        prev_balance: float) -> float:
+    """Stream a complete month sheet; returns the updated running balance.
+
+    Same layout as _write_month_sheet, emitted via ws.append for
+    write-only worksheets (which can't merge cells, so the title stays a
+    single cell).
+    """
+    # Set column widths
+    for col, width in COLUMN_WIDTHS.items():
+        ws.column_dimensions[COL_LETTERS[col]].width = width
+    # Hide the ID column
+    ws.column_dimensions[COL_LETTERS[COL_ID]].hidden = True
+
+    # Partition into out/in in one pass, accumulating the section totals as
+    # we go; zero amounts (active card checks etc.) go to the out section
+    # for visibility
+    out_txs: list[FormattedTransaction] = []
+    in_txs: list[FormattedTransaction] = []
+    total_out = 0.0
+    total_in = 0.0
+    for tx in transactions:
+        amount = tx.amount_raw
+        if amount > 0:
+            in_txs.append(tx)
+            total_in += amount
+        else:
+            out_txs.append(tx)
+            total_out -= amount
+
+    # Title
+    ws.append([_wo_cell(ws, title, font=HEADER_FONT)])
+    ws.append([])
+
+    _stream_section(ws, "OUT", out_txs, OUT_FILL, total_out)
+    ws.append([])
+    _stream_section(ws, "IN", in_txs, IN_FILL, total_in)
+    ws.append([])
+
+    net_change = total_in - total_out
+    balance = prev_balance + net_change
+
+    # Net Change row
+    ws.append([
+        _wo_cell(ws, "Net Change", font=SUMMARY_FONT, fill=SUMMARY_FILL, border=THICK_BORDER),
+        _wo_cell(ws, fill=SUMMARY_FILL, border=THICK_BORDER),
+        _wo_cell(ws, net_change, font=SUMMARY_FONT, fill=SUMMARY_FILL, border=THICK_BORDER,
+                 number_format='#,##0.00', alignment=RIGHT_ALIGN),
+    ])
+
+    # Running Balance row
+    ws.append([
+        _wo_cell(ws, "Running Balance", font=BALANCE_FONT, fill=BALANCE_FILL, border=THICK_BORDER),
+        _wo_cell(ws, fill=BALANCE_FILL, border=THICK_BORDER),
+        _wo_cell(ws, balance, font=BALANCE_FONT, fill=BALANCE_FILL, border=THICK_BORDER,
+                 number_format='#,##0.00', alignment=RIGHT_ALIGN),
+    ])
+
+    return balance
+
+
+def _stream_section(ws, section_name: str, transactions: list[FormattedTransaction],
+                    header_fill: PatternFill, section_total: float):
+    """Stream an Out or In section.
+
+    section_total is accumulated by the caller's partition pass, so the
+    TOTAL row doesn't need another sweep over the transactions.
+    """
+    # Section header
+    ws.append([
+        _wo_cell(ws, section_name, font=SECTION_FONT, fill=header_fill),
+        _wo_cell(ws, fill=header_fill),
+        _wo_cell(ws, fill=header_fill),
+    ])
+
+    # Column headers
+    ws.append([
+        _wo_cell(ws, "Date", font=COL_HEADER_FONT, border=MEDIUM_BOTTOM_BORDER),
+        _wo_cell(ws, "Description", font=COL_HEADER_FONT, border=MEDIUM_BOTTOM_BORDER),
+        _wo_cell(ws, "Amount", font=COL_HEADER_FONT, border=MEDIUM_BOTTOM_BORDER,
+                 alignment=RIGHT_ALIGN),
+    ])
+
+    # Group by category: one sort on (category, date) orders the groups and
+    # the rows inside them, so no per-category date sort is needed after
+    transactions = sorted(transactions, key=lambda t: (t.category, t.date))
+
+    for category, group in groupby(transactions, key=lambda t: t.category):
+        cat_txs = list(group)
+
+        # Category header
+        ws.append([
+            _wo_cell(ws, category, font=CATEGORY_FONT, fill=CATEGORY_FILL),
+            _wo_cell(ws, fill=CATEGORY_FILL),
+            _wo_cell(ws, fill=CATEGORY_FILL),
+        ])
+
+        cat_total = 0.0
+        for tx in cat_txs:
+            display_amount = abs(tx.amount_raw)
+            cat_total += display_amount
+
+            desc_cell = _wo_cell(ws, tx.description, border=THIN_BORDER)
+            # Add notes as a comment on the description cell
+            if tx.notes:
+                desc_cell.comment = Comment(tx.notes, "Monzo Tracker")
+
+            ws.append([
+                _wo_cell(ws, tx.date, border=THIN_BORDER),
+                desc_cell,
+                _wo_cell(ws, display_amount, border=THIN_BORDER,
+                         number_format='#,##0.00', alignment=RIGHT_ALIGN),
+                _wo_cell(ws, tx.id),
+            ])
+
+        # Category subtotal
+        ws.append([
+            _wo_cell(ws, fill=SUBTOTAL_FILL, border=SUBTOTAL_TOP_BORDER),
+            _wo_cell(ws, f"{category} subtotal", font=SUBTOTAL_FONT,
+                     fill=SUBTOTAL_FILL, border=SUBTOTAL_TOP_BORDER),
+            _wo_cell(ws, cat_total, font=SUBTOTAL_FONT, fill=SUBTOTAL_FILL,
+                     border=SUBTOTAL_TOP_BORDER, number_format='#,##0.00',
+                     alignment=RIGHT_ALIGN),
+        ])
+
+    # Section total
+    ws.append([
+        _wo_cell(ws, f"TOTAL {section_name}", font=SUMMARY_FONT, border=THICK_BORDER),
+        _wo_cell(ws, border=THICK_BORDER),
+        _wo_cell(ws, section_total, font=SUMMARY_FONT, border=THICK_BORDER,
+                 number_format='#,##0.00', alignment=RIGHT_ALIGN),
+    ])
+
+
+class SpreadsheetWriter:
+    """Collects formatted transactions and writes the workbook once.
+
+    Lets callers append rows as they stream in (e.g. while other accounts
+    are still being fetched) while the expensive workbook load/save happens
+    a single time on exit, instead of once per account.
+
+    Usage::
+
+        with SpreadsheetWriter() as writer:
+            for tx in ...:
+                writer.append(tx)
+        print(writer.written_path)
+    """
+
+    def __init__(self, filepath: str | None = None):
+        self._filepath = filepath
+        self._buffer: list[FormattedTransaction] = []
+        self.written_path: str | None = None
+
+    def append(self, tx: FormattedTransaction):
+        """Queue a single transaction for writing."""
+        self._buffer.append(tx)
+
+    def extend(self, txs: list[FormattedTransaction]):
+        """Queue a batch of transactions for writing."""
+        self._buffer.extend(txs)
+
+    def __enter__(self) -> "SpreadsheetWriter":
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        # Only write on a clean exit; a half-fetched run shouldn't touch
+        # the spreadsheet.
+        if exc_type is None and self._buffer:
+            self.written_path = write_transactions(self._buffer, self._filepath)
+        return False
+
+
+@dataclass
+class _SheetScan:
+    """Everything the readers below extract from a month sheet, in one pass."""
+
+    transactions: list[FormattedTransaction] = field(default_factory=list)
+    summary: dict = field(default_factory=dict)
+
+
+# Scan results memoized per worksheet (keyed by id) so merging and the yearly
+# overviews don't each re-walk the same cell grid. Cleared at the start of
+# every write and invalidated whenever a cached sheet is mutated or deleted.
+_SCAN_CACHE: dict[int, _SheetScan] = {}
+
+
+def _scan_sheet(ws) -> _SheetScan:
+    """Scan a month sheet once, collecting transactions and the summary.
+
+    openpyxl materializes a Python Cell object per visited cell, so the
+    separate transaction/summary readers used to pay that cost twice
+    over. A single forward pass tracks the current section and
+    category as state instead of walking upward from every transaction row.
+    """
+    cached = _SCAN_CACHE.get(id(ws))
+    if cached is not None:
+        return cached
+
+    scan = _SheetScan(summary={
+        "out_categories": {},
+        "in_categories": {},
+        "total_out": 0.0,
+        "total_in": 0.0,
+        "net_change": 0.0,
+        "running_balance": 0.0,
+    })
+    summary = scan.summary
+
+    # None until a section header is seen; transaction rows before one are
+    # treated as expenses, matching the old upward-walk default.
+    section = None
+    category = "unknown"
+
+    for row in ws.iter_rows(min_row=1, max_row=ws.max_row, min_col=1, max_col=COL_ID):
+        date_cell = row[COL_DATE - 1]
+        label = date_cell.value
+
+        if label == "OUT" or label == "IN":
+            section = label
+            category = "unknown"
+            continue
+
+        # Transaction rows carry their ID in the hidden column
+        tx_id = row[COL_ID - 1].value
+        if tx_id and str(tx_id).startswith("tx_"):
+            desc_cell = row[COL_DESC - 1]
+            amount_val = float(row[COL_AMOUNT - 1].value or 0)
+            if section == "IN":
+                amount_raw = abs(amount_val)
+            else:
+                amount_raw = -abs(amount_val)
+
+            scan.transactions.append(FormattedTransaction(
+                id=str(tx_id),
+                date=str(label),
+                description=str(desc_cell.value),
+                amount=f"GBP {amount_raw:.2f}",
+                amount_raw=amount_raw,
+                amount_pence=round(amount_raw * 100),
+                currency="GBP",
+                notes=desc_cell.comment.text if desc_cell.comment else "",
+                category=category,
+            ))
+            continue
+
+        # Category headers are the bold+italic rows in column A
+        font = date_cell.font
+        if font and font.bold and font.italic:
+            category = str(label or "unknown")
+            continue
+
+        # Category subtotal rows name the category in the description column
+        desc = row[COL_DESC - 1].value
+        if desc and isinstance(desc, str) and desc.endswith(" subtotal"):
+            cat_total = float(row[COL_AMOUNT - 1].value or 0)
+            if section == "OUT":
+                summary["out_categories"][desc[:-len(" subtotal")]] = cat_total
+            elif section == "IN":
+                summary["in_categories"][desc[:-len(" subtotal")]] = cat_total
+            continue
+
+        if label == "TOTAL OUT":
+            summary["total_out"] = float(row[COL_AMOUNT - 1].value or 0)
+        elif label == "TOTAL IN":
+            summary["total_in"] = float(row[COL_AMOUNT - 1].value or 0)
+        elif label == "Net Change":
+            summary["net_change"] = float(row[COL_AMOUNT - 1].value or 0)
+        elif label == "Running Balance":
+            summary["running_balance"] = float(row[COL_AMOUNT - 1].value or 0)
+
+    _SCAN_CACHE[id(ws)] = scan
+    return scan
+
+
 def _read_transactions_from_sheet(ws) -> list[FormattedTransaction]:
     """Read existing transactions from a worksheet to preserve them on rebuild."""
-    transactions = []
+    return _scan_sheet(ws).transactions
+
+
+# Incremental updates with at most this many new rows are spliced into the
+# existing sheet instead of rebuilding it: O(new rows) inserts beat an
+# O(sheet) read-and-rewrite when only a handful of transactions arrived
+APPEND_THRESHOLD = 50
+
+
+def _append_month_rows(ws, new_txs: list[FormattedTransaction]) -> bool:
+    """Insert a few new transactions into an existing month sheet in place.
+
+    Returns False — without touching the sheet — when any transaction needs
+    a category block that isn't already there, and the caller falls back to
+    the full rebuild. On success the affected subtotals, section totals and
+    Net Change are patched; Running Balance is left to the chronological
+    walk in write_transactions, which re-patches drifted balances anyway.
+    """
+    # Positional pass: where each (section, category) block's transaction
+    # rows and the summary rows currently live
+    section = None
+    category = None
+    cat_rows: dict[tuple[str, str], list[tuple[str, int]]] = {}
+    subtotal_rows: dict[tuple[str, str], int] = {}
+    summary_rows: dict[str, int] = {}
+
     for row in ws.iter_rows(min_row=1, max_row=ws.max_row, min_col=1, max_col=COL_ID):
-        id_cell = row[COL_ID - 1]
-        if not id_cell.value or not str(id_cell.value).startswith("tx_"):
+        date_cell = row[COL_DATE - 1]
+        label = date_cell.value
+
+        if label == "OUT" or label == "IN":
+            section = label
+            category = None
             continue
 
-        date_cell = row[COL_DATE - 1]
-        desc_cell = row[COL_DESC - 1]
-        amount_cell = row[COL_AMOUNT - 1]
+        tx_id = row[COL_ID - 1].value
+        if tx_id and str(tx_id).startswith("tx_"):
+            if section is not None and category is not None:
+                cat_rows[(section, category)].append((str(label), date_cell.row))
+            continue
+
+        font = date_cell.font
+        if font and font.bold and font.italic and section is not None:
+            category = str(label or "unknown")
+            cat_rows.setdefault((section, category), [])
+            continue
+
+        desc = row[COL_DESC - 1].value
+        if isinstance(desc, str) and desc.endswith(" subtotal") and category is not None:
+            subtotal_rows[(section, category)] = date_cell.row
+            continue
+
+        if label in ("TOTAL OUT", "TOTAL IN", "Net Change"):
+            summary_rows[label] = date_cell.row
+
+    if not ("TOTAL OUT" in summary_rows and "TOTAL IN" in summary_rows
+            and "Net Change" in summary_rows):
+        return False
+
+    # Place every new transaction before mutating anything
+    placements: list[tuple[int, FormattedTransaction]] = []
+    deltas: dict[tuple[str, str], float] = {}
+    for tx in new_txs:
+        key = ("IN" if tx.amount_raw > 0 else "OUT", tx.category)
+        sub_row = subtotal_rows.get(key)
+        if sub_row is None:
+            return False
+        # First existing row strictly later than this one, else just above
+        # the subtotal — a rebuild's stable sort orders ties the same way
+        insert_at = sub_row
+        for date, r in cat_rows[key]:
+            if date > tx.date:
+                insert_at = r
+                break
+        placements.append((insert_at, tx))
+        deltas[key] = deltas.get(key, 0.0) + abs(tx.amount_raw)
+
+    # Insert bottom-up so higher insertion points stay valid. new_txs is
+    # date-ordered, so the stable sort keeps same-position groups in date
+    # order too.
+    placements.sort(key=lambda p: p[0])
+    hi = len(placements)
+    while hi > 0:
+        lo = hi
+        pos = placements[hi - 1][0]
+        while lo > 0 and placements[lo - 1][0] == pos:
+            lo -= 1
+        group = placements[lo:hi]
+        hi = lo
+
+        ws.insert_rows(pos, len(group))
+        r = pos
+        for _, tx in group:
+            _put(ws, r, COL_DATE, tx.date, border=THIN_BORDER)
+            desc_cell = _put(ws, r, COL_DESC, tx.description, border=THIN_BORDER)
+            _put(ws, r, COL_AMOUNT, abs(tx.amount_raw), border=THIN_BORDER,
+                 number_format='#,##0.00', alignment=RIGHT_ALIGN)
+            ws.cell(row=r, column=COL_ID, value=tx.id)
+            if tx.notes:
+                desc_cell.comment = Comment(tx.notes, "Monzo Tracker")
+            r += 1
+
+    # Rows at or below an insertion point moved down by the rows above them
+    positions = [pos for pos, _ in placements]
 
-        # Determine category from the nearest category header above this row
-        category = _find_category_for_row(ws, id_cell.row)
+    def shifted(row_idx: int) -> int:
+        return row_idx + bisect_right(positions, row_idx)
 
-        # Determine if it's income or expense from the section
-        section = _find_section_for_row(ws, id_cell.row)
-        amount_val = float(amount_cell.value or 0)
-        if section == "OUT":
-            amount_raw = -abs(amount_val)
+    total_out_delta = 0.0
+    total_in_delta = 0.0
+    for (sec, _cat), delta in deltas.items():
+        if sec == "OUT":
+            total_out_delta += delta
         else:
-            amount_raw = abs(amount_val)
-
-        notes = ""
-        if desc_cell.comment:
-            notes = desc_cell.comment.text
-
-        transactions.append(FormattedTransaction(
-            id=str(id_cell.value),
-            date=str(date_cell.value),
-            description=str(desc_cell.value),
-            amount=f"GBP {amount_raw:.2f}",
-            amount_raw=amount_raw,
-            currency="GBP",
-            category=category,
-            notes=notes,
-        ))
-    return transactions
-
-
-def _find_category_for_row(ws, target_row: int) -> str:
-    """Walk upward from target_row to find the nearest category header."""
-    for r in range(target_row - 1, 0, -1):
-        cell = ws.cell(row=r, column=COL_DATE)
-        # Category rows have the category fill and italic font
-        if cell.font and cell.font.italic and cell.font.bold:
-            return str(cell.value or "unknown")
-        # Stop if we hit a section header
-        if cell.fill and cell.fill.start_color and cell.fill.start_color.rgb in ("FFD32F2F", "FF388E3C"):
-            break
-    return "unknown"
+            total_in_delta += delta
+
+    patches = [(subtotal_rows[key], delta) for key, delta in deltas.items()]
+    patches.append((summary_rows["TOTAL OUT"], total_out_delta))
+    patches.append((summary_rows["TOTAL IN"], total_in_delta))
+    patches.append((summary_rows["Net Change"], total_in_delta - total_out_delta))
+    for row_idx, delta in patches:
+        cell = ws.cell(row=shifted(row_idx), column=COL_AMOUNT)
+        cell.value = float(cell.value or 0) + delta
 
+    # The sheet's cached scan (if any) predates these rows
+    _SCAN_CACHE.pop(id(ws), None)
+    return True
 
-def _find_section_for_row(ws, target_row: int) -> str:
-    """Walk upward from target_row to find if we're in OUT or IN section."""
-    for r in range(target_row - 1, 0, -1):
-        cell = ws.cell(row=r, column=COL_DATE)
-        val = str(cell.value or "")
-        if val == "OUT":
-            return "OUT"
-        if val == "IN":
-            return "IN"
-    return "OUT"
+
+def _clear_sheet(ws):
+    """Empty a worksheet so it can be rewritten in place.
+
+    Cheaper than del wb[name] + create_sheet, which pays for sheet-list
+    removal bookkeeping and a fresh Worksheet allocation per rebuilt month.
+    """
+    _SCAN_CACHE.pop(id(ws), None)
+    ws._cells.clear()
+    ws.merged_cells.ranges.clear()
+    ws.row_dimensions.clear()
+    ws.column_dimensions.clear()
 
 
-def _write_month_sheet(ws, title: str, transactions: list[FormattedTransaction]):
-    """Write a complete month sheet with Out/In sections."""
+def _decorate_row(ws, row: int, *, fill=None, border=None, last_col: int = COL_AMOUNT):
+    """Apply a fill and/or border across a banner row.
+
+    One cell lookup per column, instead of the separate fill and border
+    loops (each re-resolving the same cells) this replaces.
+    """
+    for col in range(COL_DATE, last_col + 1):
+        cell = ws.cell(row=row, column=col)
+        if fill is not None:
+            cell.fill = fill
+        if border is not None:
+            cell.border = border
+
+
+def _put(ws, row: int, col: int, value=None, *, font=None, fill=None,
+         border=None, number_format=None, alignment=None):
+    """Set a cell's value and styles with a single ws.cell() lookup.
+
+    The in-memory twin of _wo_cell: the value/style blocks in the writers
+    otherwise re-dispatch ws.cell for every attribute they set.
+    """
+    cell = ws.cell(row=row, column=col, value=value)
+    if font is not None:
+        cell.font = font
+    if fill is not None:
+        cell.fill = fill
+    if border is not None:
+        cell.border = border
+    if number_format is not None:
+        cell.number_format = number_format
+    if alignment is not None:
+        cell.alignment = alignment
+    return cell
+
+
+def _write_month_sheet(ws, title: str, transactions: list[FormattedTransaction],
+                       prev_balance: float = 0.0) -> float:
+    """Write a complete month sheet with Out/In sections.
+
+    Returns the running balance after this month, for the caller to carry
+    into the next one.
+    """
     # Set column widths
     for col, width in COLUMN_WIDTHS.items():
-        ws.column_dimensions[get_column_letter(col)].width = width
+        ws.column_dimensions[COL_LETTERS[col]].width = width
     # Hide the ID column
-    ws.column_dimensions[get_column_letter(COL_ID)].hidden = True
-
-    # Separate into out/in
-    out_txs = [tx for tx in transactions if tx.amount_raw < 0]
-    in_txs = [tx for tx in transactions if tx.amount_raw > 0]
-    # Skip zero-amount transactions (active card checks etc.)
-    zero_txs = [tx for tx in transactions if tx.amount_raw == 0]
-    # Include zero amounts in the out section for visibility
-    out_txs.extend(zero_txs)
+    ws.column_dimensions[COL_LETTERS[COL_ID]].hidden = True
+
+    # Partition into out/in in one pass, accumulating the section totals as
+    # we go; zero amounts (active card checks etc.) go to the out section
+    # for visibility
+    out_txs: list[FormattedTransaction] = []
+    in_txs: list[FormattedTransaction] = []
+    total_out = 0.0
+    total_in = 0.0
+    for tx in transactions:
+        amount = tx.amount_raw
+        if amount > 0:
+            in_txs.append(tx)
+            total_in += amount
+        else:
+            out_txs.append(tx)
+            total_out -= amount
 
     row = 1
 
@@ -263,40 +776,36 @@ def _write_month_sheet(ws, title: str, transactions: list[FormattedTransaction])
     row += 2
 
     # === OUT SECTION ===
-    row = _write_section(ws, row, "OUT", out_txs, OUT_FILL, is_expense=True)
+    row = _write_section(ws, row, "OUT", out_txs, OUT_FILL, is_expense=True,
+                         section_total=total_out)
 
     row += 1
 
     # === IN SECTION ===
-    row = _write_section(ws, row, "IN", in_txs, IN_FILL, is_expense=False)
+    row = _write_section(ws, row, "IN", in_txs, IN_FILL, is_expense=False,
+                         section_total=total_in)
 
     row += 1
 
     # === SUMMARY ===
-    total_out = sum(abs(tx.amount_raw) for tx in out_txs)
-    total_in = sum(abs(tx.amount_raw) for tx in in_txs)
     net_change = total_in - total_out
 
     # Net Change row
-    for col in range(COL_DATE, COL_AMOUNT + 1):
-        ws.cell(row=row, column=col).fill = SUMMARY_FILL
-        ws.cell(row=row, column=col).border = THICK_BORDER
+    _decorate_row(ws, row, fill=SUMMARY_FILL, border=THICK_BORDER)
     ws.cell(row=row, column=COL_DATE, value="Net Change").font = SUMMARY_FONT
-    change_cell = ws.cell(row=row, column=COL_AMOUNT, value=net_change)
-    change_cell.font = SUMMARY_FONT
-    change_cell.number_format = '#,##0.00'
-    change_cell.alignment = Alignment(horizontal="right")
+    _put(ws, row, COL_AMOUNT, net_change, font=SUMMARY_FONT,
+         number_format='#,##0.00', alignment=RIGHT_ALIGN)
     row += 1
 
-    # Running Balance row (will be recalculated later)
-    for col in range(COL_DATE, COL_AMOUNT + 1):
-        ws.cell(row=row, column=col).fill = BALANCE_FILL
-        ws.cell(row=row, column=col).border = THICK_BORDER
+    balance = prev_balance + net_change
+
+    # Running Balance row
+    _decorate_row(ws, row, fill=BALANCE_FILL, border=THICK_BORDER)
     ws.cell(row=row, column=COL_DATE, value="Running Balance").font = BALANCE_FONT
-    balance_cell = ws.cell(row=row, column=COL_AMOUNT, value=0.0)
-    balance_cell.font = BALANCE_FONT
-    balance_cell.number_format = '#,##0.00'
-    balance_cell.alignment = Alignment(horizontal="right")
+    _put(ws, row, COL_AMOUNT, balance, font=BALANCE_FONT,
+         number_format='#,##0.00', alignment=RIGHT_ALIGN)
+
+    return balance
 
 
 def _write_section(
@@ -306,42 +815,41 @@ def _write_section(
     transactions: list[FormattedTransaction],
     header_fill: PatternFill,
     is_expense: bool,
+    section_total: float,
 ) -> int:
-    """Write an Out or In section. Returns the next available row."""
+    """Write an Out or In section. Returns the next available row.
+
+    section_total is accumulated by the caller's partition pass, so this
+    function doesn't re-sum every transaction for the TOTAL row.
+    """
     row = start_row
 
+    # Bind the bound method once; the loops below hit it several times per row
+    put = ws.cell
+
     # Section header
-    for col in range(COL_DATE, COL_AMOUNT + 1):
-        ws.cell(row=row, column=col).fill = header_fill
-    ws.cell(row=row, column=COL_DATE, value=section_name).font = SECTION_FONT
+    _decorate_row(ws, row, fill=header_fill)
+    put(row=row, column=COL_DATE, value=section_name).font = SECTION_FONT
     row += 1
 
     # Column headers
-    ws.cell(row=row, column=COL_DATE, value="Date").font = COL_HEADER_FONT
-    ws.cell(row=row, column=COL_DESC, value="Description").font = COL_HEADER_FONT
-    amount_header = ws.cell(row=row, column=COL_AMOUNT, value="Amount")
-    amount_header.font = COL_HEADER_FONT
-    amount_header.alignment = Alignment(horizontal="right")
-    for col in range(COL_DATE, COL_AMOUNT + 1):
-        ws.cell(row=row, column=col).border = Border(bottom=Side(style="medium"))
+    put(row=row, column=COL_DATE, value="Date").font = COL_HEADER_FONT
+    put(row=row, column=COL_DESC, value="Description").font = COL_HEADER_FONT
+    _put(ws, row, COL_AMOUNT, "Amount", font=COL_HEADER_FONT,
+         alignment=RIGHT_ALIGN)
+    _decorate_row(ws, row, border=MEDIUM_BOTTOM_BORDER)
     row += 1
 
-    # Group by category
-    by_category: dict[str, list[FormattedTransaction]] = defaultdict(list)
-    for tx in transactions:
-        by_category[tx.category].append(tx)
-
-    section_total = 0.0
+    # Group by category: one sort on (category, date) orders the groups and
+    # the rows inside them, so no per-category date sort is needed after
+    transactions = sorted(transactions, key=lambda t: (t.category, t.date))
 
-    for category in sorted(by_category.keys()):
-        cat_txs = by_category[category]
-        # Sort by date within category
-        cat_txs.sort(key=lambda x: x.date)
+    for category, group in groupby(transactions, key=lambda t: t.category):
+        cat_txs = list(group)
 
         # Category header
-        for col in range(COL_DATE, COL_AMOUNT + 1):
-            ws.cell(row=row, column=col).fill = CATEGORY_FILL
-        ws.cell(row=row, column=COL_DATE, value=category).font = CATEGORY_FONT
+        _decorate_row(ws, row, fill=CATEGORY_FILL)
+        put(row=row, column=COL_DATE, value=category).font = CATEGORY_FONT
         row += 1
 
         cat_total = 0.0
@@ -349,85 +857,68 @@ def _write_section(
             display_amount = abs(tx.amount_raw)
             cat_total += display_amount
 
-            ws.cell(row=row, column=COL_DATE, value=tx.date)
-            desc_cell = ws.cell(row=row, column=COL_DESC, value=tx.description)
-            amount_cell = ws.cell(row=row, column=COL_AMOUNT, value=display_amount)
-            amount_cell.number_format = '#,##0.00'
-            amount_cell.alignment = Alignment(horizontal="right")
-            ws.cell(row=row, column=COL_ID, value=tx.id)
+            _put(ws, row, COL_DATE, tx.date, border=THIN_BORDER)
+            desc_cell = _put(ws, row, COL_DESC, tx.description, border=THIN_BORDER)
+            _put(ws, row, COL_AMOUNT, display_amount, border=THIN_BORDER,
+                 number_format='#,##0.00', alignment=RIGHT_ALIGN)
+            put(row=row, column=COL_ID, value=tx.id)
 
             # Add notes as a comment on the description cell
             if tx.notes:
                 desc_cell.comment = Comment(tx.notes, "Monzo Tracker")
 
-            for col in range(COL_DATE, COL_AMOUNT + 1):
-                ws.cell(row=row, column=col).border = THIN_BORDER
-
             row += 1
 
         # Category subtotal
-        for col in range(COL_DATE, COL_AMOUNT + 1):
-            ws.cell(row=row, column=col).fill = SUBTOTAL_FILL
-        ws.cell(row=row, column=COL_DESC, value=f"{category} subtotal").font = Font(italic=True, size=9)
-        subtotal_cell = ws.cell(row=row, column=COL_AMOUNT, value=cat_total)
-        subtotal_cell.font = Font(italic=True, size=9)
-        subtotal_cell.number_format = '#,##0.00'
-        subtotal_cell.alignment = Alignment(horizontal="right")
-        for col in range(COL_DATE, COL_AMOUNT + 1):
-            ws.cell(row=row, column=col).border = Border(top=Side(style="thin"))
+        _decorate_row(ws, row, fill=SUBTOTAL_FILL, border=SUBTOTAL_TOP_BORDER)
+        put(row=row, column=COL_DESC, value=f"{category} subtotal").font = SUBTOTAL_FONT
+        _put(ws, row, COL_AMOUNT, cat_total, font=SUBTOTAL_FONT,
+             number_format='#,##0.00', alignment=RIGHT_ALIGN)
         row += 1
 
-        section_total += cat_total
-
     # Section total
-    for col in range(COL_DATE, COL_AMOUNT + 1):
-        ws.cell(row=row, column=col).border = THICK_BORDER
-    ws.cell(row=row, column=COL_DATE, value=f"TOTAL {section_name}").font = SUMMARY_FONT
-    total_cell = ws.cell(row=row, column=COL_AMOUNT, value=section_total)
-    total_cell.font = SUMMARY_FONT
-    total_cell.number_format = '#,##0.00'
-    total_cell.alignment = Alignment(horizontal="right")
+    _decorate_row(ws, row, border=THICK_BORDER)
+    put(row=row, column=COL_DATE, value=f"TOTAL {section_name}").font = SUMMARY_FONT
+    _put(ws, row, COL_AMOUNT, section_total, font=SUMMARY_FONT,
+         number_format='#,##0.00', alignment=RIGHT_ALIGN)
     row += 1
 
     return row
 
 
 def _sort_sheets(wb):
-    """Sort workbook sheets: yearly overviews first, then monthly chronologically."""
-    sheet_order = []
-    for name in wb.sheetnames:
+    """Sort workbook sheets: each year's overview first, then its months."""
+    def sort_key(ws) -> tuple[int, int, int]:
+        name = ws.title
+
         # Yearly overview sheets like "2026 Overview"
         if name.endswith(" Overview"):
             try:
-                year = int(name.split(" ")[0])
-                # Sort key: Jan 1 of that year, but slightly before monthly sheets
-                sheet_order.append((datetime(year, 1, 1, 0, 0, 0), name))
-            except (ValueError, IndexError):
-                sheet_order.append((datetime.max, name))
-            continue
+                return (int(name.split(" ")[0]), 0, 0)
+            except ValueError:
+                pass
+        else:
+            # Monthly sheets like "January 2026"
+            month_name, _, year = name.partition(" ")
+            month = MONTH_NUM.get(month_name)
+            if month is not None and year.isdigit():
+                return (int(year), 1, month)
 
-        # Monthly sheets like "January 2026"
-        try:
-            dt = datetime.strptime(name, "%B %Y")
-            # Offset by 1 hour so monthly sheets sort after the yearly overview
-            sheet_order.append((datetime(dt.year, dt.month, 1, 1, 0, 0), name))
-        except ValueError:
-            sheet_order.append((datetime.max, name))
+        # Unrecognized sheets keep their relative order, after everything
+        return (9999, 2, 0)
 
-    sheet_order.sort(key=lambda x: x[0])
-    wb._sheets = [wb[name] for _, name in sheet_order]
+    # Sort the sheet list in place — no per-name wb[name] lookups
+    wb._sheets.sort(key=sort_key)
 
 
-def _recalculate_balances(wb):
-    """Recalculate running balances across all month sheets in order."""
-    balance = 0.0
-    for ws in wb._sheets:
-        for row in ws.iter_rows(min_row=1, max_row=ws.max_row, min_col=COL_DATE, max_col=COL_AMOUNT):
-            if row[0].value == "Net Change":
-                net_change = float(row[COL_AMOUNT - 1].value or 0)
-            if row[0].value == "Running Balance":
-                balance += net_change
-                row[COL_AMOUNT - 1].value = balance
+def _set_running_balance(ws, balance: float):
+    """Patch the Running Balance cell on an existing month sheet."""
+    # The sheet's cached scan (if any) now holds a stale balance
+    _SCAN_CACHE.pop(id(ws), None)
+    for row in ws.iter_rows(min_row=1, max_row=ws.max_row, min_col=COL_DATE, max_col=COL_AMOUNT):
+        if row[0].value == "Running Balance":
+            row[COL_AMOUNT - 1].value = balance
+            return
 
 
 def _extract_month_summary(ws) -> dict:
@@ -441,73 +932,40 @@ def _extract_month_summary(ws) -> dict:
         net_change: float
         running_balance: float
     """
-    result = {
-        "out_categories": {},
-        "in_categories": {},
-        "total_out": 0.0,
-        "total_in": 0.0,
-        "net_change": 0.0,
-        "running_balance": 0.0,
-    }
+    return _scan_sheet(ws).summary
 
-    current_section = None
 
-    for row in ws.iter_rows(min_row=1, max_row=ws.max_row, min_col=1, max_col=3, values_only=False):
-        label = row[0].value
-        amount = row[2].value
+def _write_yearly_overviews(wb, changed_years: set[str] | None = None):
+    """Create/rebuild yearly overview sheets from monthly data.
 
-        if label == "OUT":
-            current_section = "out"
-            continue
-        if label == "IN":
-            current_section = "in"
-            continue
-
-        # Category subtotal rows
-        desc = row[1].value
-        if desc and isinstance(desc, str) and desc.endswith(" subtotal"):
-            cat_name = desc.replace(" subtotal", "")
-            cat_total = float(amount or 0)
-            if current_section == "out":
-                result["out_categories"][cat_name] = cat_total
-            elif current_section == "in":
-                result["in_categories"][cat_name] = cat_total
-            continue
-
-        if label == "TOTAL OUT":
-            result["total_out"] = float(amount or 0)
-        elif label == "TOTAL IN":
-            result["total_in"] = float(amount or 0)
-        elif label == "Net Change":
-            result["net_change"] = float(amount or 0)
-        elif label == "Running Balance":
-            result["running_balance"] = float(amount or 0)
-
-    return result
-
-
-def _write_yearly_overviews(wb):
-    """Create/rebuild yearly overview sheets from monthly data."""
-    # Collect monthly sheets grouped by year
-    by_year: dict[str, list[tuple[str, str]]] = defaultdict(list)  # year -> [(month_key, sheet_name)]
+    When changed_years is given, years outside it keep their existing
+    overview untouched — an incremental ingest hitting one month doesn't
+    re-scan and rewrite every other year.
+    """
+    # Collect monthly sheets as (month_key, sheet_name); month keys sort
+    # chronologically, so one sort orders the years and the months in them
+    month_sheets: list[tuple[str, str]] = []
     for name in wb.sheetnames:
-        try:
-            dt = datetime.strptime(name, "%B %Y")
-            year = str(dt.year)
-            month_key = dt.strftime("%Y-%m")
-            by_year[year].append((month_key, name))
-        except ValueError:
-            continue
+        mk = _parse_sheet_month(name)
+        if mk is not None:
+            month_sheets.append((mk, name))
+    month_sheets.sort()
 
-    for year, months in by_year.items():
-        months.sort(key=lambda x: x[0])
+    for year, group in groupby(month_sheets, key=lambda ms: ms[0][:4]):
+        months = list(group)
         overview_name = f"{year} Overview"
 
-        # Remove existing overview sheet to rebuild
-        if overview_name in wb.sheetnames:
-            del wb[overview_name]
+        # Unchanged year with an overview already in place: leave it alone
+        if (changed_years is not None and year not in changed_years
+                and overview_name in wb.sheetnames):
+            continue
 
-        ws = wb.create_sheet(title=overview_name)
+        # Rebuild any existing overview sheet in place
+        if overview_name in wb.sheetnames:
+            ws = wb[overview_name]
+            _clear_sheet(ws)
+        else:
+            ws = wb.create_sheet(title=overview_name)
         _write_yearly_sheet(wb, ws, year, months)
 
     # Re-sort so overviews appear before their year's months
@@ -556,27 +1014,30 @@ def _write_yearly_sheet(wb, ws, year: str, months: list[tuple[str, str]]):
         if mk in data_month_set:
             data_col_indices.append(i + 2)
 
-    # Formula helpers
+    # Formula helpers. The data columns are fixed per sheet, so resolve
+    # their letters once and only format row numbers per call.
+    data_col_letters = [COL_LETTERS[c] for c in data_col_indices]
+
     def avg_of_data(r):
         """SUM of data month cells / count — treats empty cells as 0."""
-        refs = ",".join(f"{get_column_letter(c)}{r}" for c in data_col_indices)
+        refs = ",".join(f"{cl}{r}" for cl in data_col_letters)
         return f"=SUM({refs})/{num_data}"
 
     def sum_row(r):
         """SUM across all 12 month columns for the Total column."""
-        return f"=SUM({get_column_letter(2)}{r}:{get_column_letter(13)}{r})"
+        return f"=SUM({COL_LETTERS[2]}{r}:{COL_LETTERS[13]}{r})"
 
     def sum_cells(col, rows):
         """SUM of specific cells in a column (for TOTAL rows from categories)."""
-        cl = get_column_letter(col)
+        cl = COL_LETTERS[col]
         refs = ",".join(f"{cl}{r}" for r in rows)
         return f"=SUM({refs})"
 
     # Column widths
     ws.column_dimensions["A"].width = YEAR_LABEL_WIDTH
     for i in range(12):
-        ws.column_dimensions[get_column_letter(i + 2)].width = YEAR_MONTH_WIDTH
-    ws.column_dimensions[get_column_letter(total_col)].width = YEAR_MONTH_WIDTH
+        ws.column_dimensions[COL_LETTERS[i + 2]].width = YEAR_MONTH_WIDTH
+    ws.column_dimensions[COL_LETTERS[total_col]].width = YEAR_MONTH_WIDTH
 
     row = 1
 
@@ -587,21 +1048,15 @@ def _write_yearly_sheet(wb, ws, year: str, months: list[tuple[str, str]]):
 
     # Month headers
     for i, name in enumerate(month_short_names):
-        col = i + 2
-        cell = ws.cell(row=row, column=col, value=name)
-        cell.font = COL_HEADER_FONT
-        cell.alignment = Alignment(horizontal="right")
-        cell.border = Border(bottom=Side(style="medium"))
-    total_header = ws.cell(row=row, column=total_col, value="Total")
-    total_header.font = Font(bold=True, size=10)
-    total_header.alignment = Alignment(horizontal="right")
-    total_header.border = Border(bottom=Side(style="medium"))
-    ws.cell(row=row, column=1).border = Border(bottom=Side(style="medium"))
+        _put(ws, row, i + 2, name, font=COL_HEADER_FONT, alignment=RIGHT_ALIGN,
+             border=MEDIUM_BOTTOM_BORDER)
+    _put(ws, row, total_col, "Total", font=YEAR_TOTAL_HEADER_FONT,
+         alignment=RIGHT_ALIGN, border=MEDIUM_BOTTOM_BORDER)
+    ws.cell(row=row, column=1).border = MEDIUM_BOTTOM_BORDER
     row += 1
 
     # === OUT SECTION ===
-    for col in range(1, total_col + 1):
-        ws.cell(row=row, column=col).fill = OUT_FILL
+    _decorate_row(ws, row, fill=OUT_FILL, last_col=total_col)
     ws.cell(row=row, column=1, value="OUT").font = SECTION_FONT
     row += 1
 
@@ -610,53 +1065,43 @@ def _write_yearly_sheet(wb, ws, year: str, months: list[tuple[str, str]]):
         ws.cell(row=row, column=1, value=f"  {cat}").font = CATEGORY_FONT
         out_cat_rows.append(row)
 
+        # Same projection formula for every future month in this row
+        projected_formula = avg_of_data(row)
         for i, mk in enumerate(all_month_keys):
             col = i + 2
             if mk in data_month_set:
                 val = summaries[mk]["out_categories"].get(cat, 0.0)
                 if val:
-                    cell = ws.cell(row=row, column=col, value=val)
-                    cell.number_format = '#,##0.00'
-                    cell.alignment = Alignment(horizontal="right")
+                    _put(ws, row, col, val, number_format='#,##0.00',
+                         alignment=RIGHT_ALIGN)
             else:
-                cell = ws.cell(row=row, column=col, value=avg_of_data(row))
-                cell.number_format = '#,##0.00'
-                cell.alignment = Alignment(horizontal="right")
-                cell.font = PROJECTED_FONT
-
-        tc = ws.cell(row=row, column=total_col, value=sum_row(row))
-        tc.number_format = '#,##0.00'
-        tc.alignment = Alignment(horizontal="right")
-        tc.font = Font(bold=True, size=9)
-        for col in range(1, total_col + 1):
-            ws.cell(row=row, column=col).border = THIN_BORDER
+                _put(ws, row, col, projected_formula, font=PROJECTED_FONT,
+                     number_format='#,##0.00', alignment=RIGHT_ALIGN)
+
+        _put(ws, row, total_col, sum_row(row), font=YEAR_CAT_TOTAL_FONT,
+             number_format='#,##0.00', alignment=RIGHT_ALIGN)
+        _decorate_row(ws, row, border=THIN_BORDER, last_col=total_col)
         row += 1
 
     # TOTAL OUT
     total_out_row = row
-    for col in range(1, total_col + 1):
-        ws.cell(row=row, column=col).border = THICK_BORDER
+    _decorate_row(ws, row, border=THICK_BORDER, last_col=total_col)
     ws.cell(row=row, column=1, value="TOTAL OUT").font = SUMMARY_FONT
     for i, mk in enumerate(all_month_keys):
         col = i + 2
         if mk in data_month_set:
-            val = summaries[mk]["total_out"]
-            cell = ws.cell(row=row, column=col, value=val)
-            cell.font = SUMMARY_FONT
+            _put(ws, row, col, summaries[mk]["total_out"], font=SUMMARY_FONT,
+                 number_format='#,##0.00', alignment=RIGHT_ALIGN)
         else:
-            cell = ws.cell(row=row, column=col, value=sum_cells(col, out_cat_rows))
-            cell.font = PROJECTED_SUMMARY_FONT
-        cell.number_format = '#,##0.00'
-        cell.alignment = Alignment(horizontal="right")
-    tc = ws.cell(row=row, column=total_col, value=sum_row(row))
-    tc.number_format = '#,##0.00'
-    tc.alignment = Alignment(horizontal="right")
-    tc.font = SUMMARY_FONT
+            _put(ws, row, col, sum_cells(col, out_cat_rows),
+                 font=PROJECTED_SUMMARY_FONT, number_format='#,##0.00',
+                 alignment=RIGHT_ALIGN)
+    _put(ws, row, total_col, sum_row(row), font=SUMMARY_FONT,
+         number_format='#,##0.00', alignment=RIGHT_ALIGN)
     row += 2
 
     # === IN SECTION ===
-    for col in range(1, total_col + 1):
-        ws.cell(row=row, column=col).fill = IN_FILL
+    _decorate_row(ws, row, fill=IN_FILL, last_col=total_col)
     ws.cell(row=row, column=1, value="IN").font = SECTION_FONT
     row += 1
 
@@ -665,84 +1110,66 @@ def _write_yearly_sheet(wb, ws, year: str, months: list[tuple[str, str]]):
         ws.cell(row=row, column=1, value=f"  {cat}").font = CATEGORY_FONT
         in_cat_rows.append(row)
 
+        # Same projection formula for every future month in this row
+        projected_formula = avg_of_data(row)
         for i, mk in enumerate(all_month_keys):
             col = i + 2
             if mk in data_month_set:
                 val = summaries[mk]["in_categories"].get(cat, 0.0)
                 if val:
-                    cell = ws.cell(row=row, column=col, value=val)
-                    cell.number_format = '#,##0.00'
-                    cell.alignment = Alignment(horizontal="right")
+                    _put(ws, row, col, val, number_format='#,##0.00',
+                         alignment=RIGHT_ALIGN)
             else:
-                cell = ws.cell(row=row, column=col, value=avg_of_data(row))
-                cell.number_format = '#,##0.00'
-                cell.alignment = Alignment(horizontal="right")
-                cell.font = PROJECTED_FONT
-
-        tc = ws.cell(row=row, column=total_col, value=sum_row(row))
-        tc.number_format = '#,##0.00'
-        tc.alignment = Alignment(horizontal="right")
-        tc.font = Font(bold=True, size=9)
-        for col in range(1, total_col + 1):
-            ws.cell(row=row, column=col).border = THIN_BORDER
+                _put(ws, row, col, projected_formula, font=PROJECTED_FONT,
+                     number_format='#,##0.00', alignment=RIGHT_ALIGN)
+
+        _put(ws, row, total_col, sum_row(row), font=YEAR_CAT_TOTAL_FONT,
+             number_format='#,##0.00', alignment=RIGHT_ALIGN)
+        _decorate_row(ws, row, border=THIN_BORDER, last_col=total_col)
         row += 1
 
     # TOTAL IN
     total_in_row = row
-    for col in range(1, total_col + 1):
-        ws.cell(row=row, column=col).border = THICK_BORDER
+    _decorate_row(ws, row, border=THICK_BORDER, last_col=total_col)
     ws.cell(row=row, column=1, value="TOTAL IN").font = SUMMARY_FONT
     for i, mk in enumerate(all_month_keys):
         col = i + 2
         if mk in data_month_set:
-            val = summaries[mk]["total_in"]
-            cell = ws.cell(row=row, column=col, value=val)
-            cell.font = SUMMARY_FONT
+            _put(ws, row, col, summaries[mk]["total_in"], font=SUMMARY_FONT,
+                 number_format='#,##0.00', alignment=RIGHT_ALIGN)
         else:
-            cell = ws.cell(row=row, column=col, value=sum_cells(col, in_cat_rows))
-            cell.font = PROJECTED_SUMMARY_FONT
-        cell.number_format = '#,##0.00'
-        cell.alignment = Alignment(horizontal="right")
-    tc = ws.cell(row=row, column=total_col, value=sum_row(row))
-    tc.number_format = '#,##0.00'
-    tc.alignment = Alignment(horizontal="right")
-    tc.font = SUMMARY_FONT
+            _put(ws, row, col, sum_cells(col, in_cat_rows),
+                 font=PROJECTED_SUMMARY_FONT, number_format='#,##0.00',
+                 alignment=RIGHT_ALIGN)
+    _put(ws, row, total_col, sum_row(row), font=SUMMARY_FONT,
+         number_format='#,##0.00', alignment=RIGHT_ALIGN)
     row += 2
 
     # === NET CHANGE ===
     net_change_row = row
-    for col in range(1, total_col + 1):
-        ws.cell(row=row, column=col).fill = SUMMARY_FILL
-        ws.cell(row=row, column=col).border = THICK_BORDER
+    _decorate_row(ws, row, fill=SUMMARY_FILL, border=THICK_BORDER, last_col=total_col)
     ws.cell(row=row, column=1, value="Net Change").font = SUMMARY_FONT
     for i, mk in enumerate(all_month_keys):
         col = i + 2
-        cl = get_column_letter(col)
         if mk in data_month_set:
-            val = summaries[mk]["net_change"]
-            cell = ws.cell(row=row, column=col, value=val)
-            cell.font = SUMMARY_FONT
+            _put(ws, row, col, summaries[mk]["net_change"], font=SUMMARY_FONT,
+                 number_format='#,##0.00', alignment=RIGHT_ALIGN)
         else:
-            cell = ws.cell(row=row, column=col,
-                           value=f"={cl}{total_in_row}-{cl}{total_out_row}")
-            cell.font = PROJECTED_SUMMARY_FONT
-        cell.number_format = '#,##0.00'
-        cell.alignment = Alignment(horizontal="right")
-    tc = ws.cell(row=row, column=total_col, value=sum_row(row))
-    tc.number_format = '#,##0.00'
-    tc.alignment = Alignment(horizontal="right")
-    tc.font = SUMMARY_FONT
+            cl = COL_LETTERS[col]
+            _put(ws, row, col, f"={cl}{total_in_row}-{cl}{total_out_row}",
+                 font=PROJECTED_SUMMARY_FONT, number_format='#,##0.00',
+                 alignment=RIGHT_ALIGN)
+    _put(ws, row, total_col, sum_row(row), font=SUMMARY_FONT,
+         number_format='#,##0.00', alignment=RIGHT_ALIGN)
     row += 1
 
     # === RUNNING BALANCE ===
     balance_row = row
-    for col in range(1, total_col + 1):
-        ws.cell(row=row, column=col).fill = BALANCE_FILL
-        ws.cell(row=row, column=col).border = THICK_BORDER
+    _decorate_row(ws, row, fill=BALANCE_FILL, border=THICK_BORDER, last_col=total_col)
     ws.cell(row=row, column=1, value="Running Balance").font = BALANCE_FONT
     for i, mk in enumerate(all_month_keys):
         col = i + 2
-        cl = get_column_letter(col)
+        cl = COL_LETTERS[col]
         if mk in data_month_set:
             val = summaries[mk]["running_balance"]
             cell = ws.cell(row=row, column=col, value=val)
@@ -752,15 +1179,15 @@ def _write_yearly_sheet(wb, ws, year: str, months: list[tuple[str, str]]):
                 # First month (Jan) with no data: balance = net change
                 formula = f"={cl}{net_change_row}"
             else:
-                prev_cl = get_column_letter(col - 1)
+                prev_cl = COL_LETTERS[col - 1]
                 formula = f"={prev_cl}{balance_row}+{cl}{net_change_row}"
             cell = ws.cell(row=row, column=col, value=formula)
             cell.font = PROJECTED_BALANCE_FONT
         cell.number_format = '#,##0.00'
-        cell.alignment = Alignment(horizontal="right")
+        cell.alignment = RIGHT_ALIGN
     # Total column: last month's running balance (Dec)
     tc = ws.cell(row=row, column=total_col,
-                 value=f"={get_column_letter(13)}{balance_row}")
+                 value=f"={COL_LETTERS[13]}{balance_row}")
     tc.number_format = '#,##0.00'
-    tc.alignment = Alignment(horizontal="right")
+    tc.alignment = RIGHT_ALIGN
     tc.font = BALANCE_FONT